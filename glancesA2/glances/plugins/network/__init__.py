@@ -92,6 +92,28 @@ class PluginModel(GlancesPluginModel):
         # or that don't have any IP addresses #2799
         self.hide_no_up = config.get_bool_value(self.plugin_name, 'hide_no_up', default=False)
         self.hide_no_ip = config.get_bool_value(self.plugin_name, 'hide_no_ip', default=False)
+        if not self.hide_no_ip:
+            # Interface addresses (net_if_addrs, slow on some OSes) are only needed to hide interfaces without IP
+            logger.debug('hide_no_ip is disabled, network interface addresses will not be grabbed')
+
+        # Show/hide configuration check cache (interface_name: bool)
+        self._display_cache = {}
+
+        # MAC addresses cache (interface_name: mac_address)
+        # getmac reads files or runs a command on each call, so only do it once per interface
+        self._mac_cache = {}
+
+        # Interface real name and name to display (computed in update_views)
+        self._if_names = {}
+
+        # Interfaces to hide because their stats have never been != 0 (computed in update_views)
+        self._hidden_mask = {}
+
+        # Last stats list and its sorted version (see sorted_stats)
+        self._sorted_stats_cache = (None, [])
+
+        # Last stats list, display mode and formatted columns per interface (see msg_curse)
+        self._columns_cache = (None, None, {})
 
         # Force a first update because we need two updates to have the first stat
         self.update()
@@ -101,6 +123,27 @@ class PluginModel(GlancesPluginModel):
         """Return the key of the list."""
         return 'interface_name'
 
+    def sorted_stats(self):
+        """Get the stats sorted by an alias (if present) or key.
+
+        The sorted list is cached until a new stats list is set (update or set_stats).
+        """
+        stats, sorted_stats = self._sorted_stats_cache
+        if stats is not self.stats:
+            sorted_stats = super().sorted_stats()
+            self._sorted_stats_cache = (self.stats, sorted_stats)
+        return sorted_stats
+
+    def is_display_interface(self, interface_name):
+        """Return True if the interface should be displayed (show/hide configuration).
+
+        Memoized because the configuration does not change and interface names rarely do.
+        """
+        display = self._display_cache.get(interface_name)
+        if display is None:
+            display = self._display_cache[interface_name] = self.is_display(interface_name)
+        return display
+
     # @GlancesPluginModel._check_decorator
     @GlancesPluginModel._log_result_decorator
     def update(self):
@@ -127,15 +170,17 @@ class PluginModel(GlancesPluginModel):
         try:
             net_io_counters = psutil.net_io_counters(pernic=True)
             net_status = psutil.net_if_stats()
-            net_addrs = psutil.net_if_addrs()
         except OSError as e:
             logger.debug(f'Cannot get network interface stats ({e})')
             return self.stats
 
+        # Interfaces to display: with a status (cheap dict lookup) and not hidden by the configuration
+        # or KeyError: 'eth0' when interface is not connected #1348
+        interface_names = [k for k in net_io_counters if k in net_status and self.is_display_interface(k)]
+
         # Loop through each network interface and update stats
-        for interface_name, interface_stat in net_io_counters.items():
-            if not self.is_display(interface_name) or interface_name not in net_status:
-                continue
+        for interface_name in interface_names:
+            interface_stat = net_io_counters[interface_name]
 
             # Filter stats to keep only the necessary fields
             stat = self.filter_stats(interface_stat)
@@ -145,8 +190,13 @@ class PluginModel(GlancesPluginModel):
             stat['key'] = self.get_key()
             stat['interface_name'] = interface_name
 
-            # Add the MAC address for this interface
-            mac_address = get_mac_address(interface=interface_name)
+            # Add the MAC address for this interface (grabbed once, then read from the cache)
+            # A failed lookup is not cached, it will be retried on the next update
+            mac_address = self._mac_cache.get(interface_name)
+            if mac_address is None:
+                mac_address = get_mac_address(interface=interface_name)
+                if mac_address:
+                    self._mac_cache[interface_name] = mac_address
             stat['mac_address'] = mac_address if mac_address else 'Unknown'
 
             # Add other existing stats (sent/recv, speed, etc.)
@@ -156,6 +206,11 @@ class PluginModel(GlancesPluginModel):
 
             stats.append(stat)
 
+        # Only keep the MAC addresses of the current interfaces (interfaces come and go on container hosts)
+        self._mac_cache = {k: self._mac_cache[k] for k in interface_names if k in self._mac_cache}
+        # Hidden interfaces are kept as well, so their show/hide check is not done again on each update
+        self._display_cache = {k: v for k, v in self._display_cache.items() if k in net_io_counters}
+
         return stats
 
     def update_views(self):
@@ -164,6 +219,14 @@ class PluginModel(GlancesPluginModel):
         super().update_views()
 
         # Add specifics information
+        # Interface real name (without the ':' suffix) and name to display (alias or real name)
+        # Computed once per update instead of on each render
+        key_name = self.get_key()
+        self._if_names = {}
+        for i in self.get_raw():
+            if_real_name = i[key_name].split(':', 1)[0]
+            self._if_names[i[key_name]] = (if_real_name, i.get('alias') or if_real_name)
+
         # Alert
         for i in self.get_raw():
             # Skip alert if no timespan to measure
@@ -175,7 +238,7 @@ class PluginModel(GlancesPluginModel):
             bps_tx = int(i['bytes_sent_rate_per_sec'] * 8)
 
             # Decorate the bitrate with the configuration file thresholds
-            if_real_name = i['interface_name'].split(':')[0]
+            if_real_name = self._if_names[i[key_name]][0]
             alert_rx = self.get_alert(bps_rx, header=if_real_name + '_rx')
             alert_tx = self.get_alert(bps_tx, header=if_real_name + '_tx')
 
@@ -187,8 +250,29 @@ class PluginModel(GlancesPluginModel):
                 alert_tx = self.get_alert(current=bps_tx, maximum=i['speed'], header='tx')
 
             # then decorate
-            self.views[i[self.get_key()]]['bytes_recv']['decoration'] = alert_rx
-            self.views[i[self.get_key()]]['bytes_sent']['decoration'] = alert_tx
+            view = self.views[i[key_name]]
+            view['bytes_recv']['decoration'] = alert_rx
+            view['bytes_sent']['decoration'] = alert_tx
+
+        # Hide stats if never been different from 0 (issue #1787)
+        # Computed once per update instead of on each render
+        self._hidden_mask = {
+            i[key_name]: all(self.get_views(item=i[key_name], key=f, option='hidden') for f in self.hide_zero_fields)
+            for i in self.get_raw()
+        }
+
+    def format_columns(self, stat, to_bit, unit, cumul):
+        """Return the (Rx, Tx, Rx+Tx) human-readable strings of the interface stat.
+
+        Return None if the rates are not available yet.
+        """
+        if cumul and 'bytes_recv' in stat:
+            fields = ('bytes_recv', 'bytes_sent', 'bytes_all')
+        elif 'bytes_recv_rate_per_sec' in stat:
+            fields = ('bytes_recv_rate_per_sec', 'bytes_sent_rate_per_sec', 'bytes_all_rate_per_sec')
+        else:
+            return None
+        return tuple(self.auto_unit(int(stat[f] * to_bit)) + unit for f in fields)
 
     def msg_curse(self, args=None, max_width=None):
         """Return the dict to display in the curse interface."""
@@ -208,47 +292,64 @@ class PluginModel(GlancesPluginModel):
             return ret
 
         # Header
-        msg = '{:{width}}'.format('NETWORK', width=name_max_width)
+        msg = 'NETWORK'.ljust(name_max_width)
         ret.append(self.curse_add_line(msg, "TITLE"))
         if args.network_cumul:
             # Cumulative stats
             if args.network_sum:
                 # Sum stats
-                msg = '{:>14}'.format('Rx+Tx')
+                msg = 'Rx+Tx'.rjust(14)
                 ret.append(self.curse_add_line(msg))
             else:
                 # Rx/Tx stats
-                msg = '{:>7}'.format('Rx')
+                msg = 'Rx'.rjust(7)
                 ret.append(self.curse_add_line(msg))
-                msg = '{:>7}'.format('Tx')
+                msg = 'Tx'.rjust(7)
                 ret.append(self.curse_add_line(msg))
         else:
             # Bitrate stats
             if args.network_sum:
                 # Sum stats
-                msg = '{:>14}'.format('Rx+Tx/s')
+                msg = 'Rx+Tx/s'.rjust(14)
                 ret.append(self.curse_add_line(msg))
             else:
-                msg = '{:>7}'.format('Rx/s')
+                msg = 'Rx/s'.rjust(7)
                 ret.append(self.curse_add_line(msg))
-                msg = '{:>7}'.format('Tx/s')
+                msg = 'Tx/s'.rjust(7)
                 ret.append(self.curse_add_line(msg))
 
+        # Display Rx/Tx or cumulative stats
+        if args.byte:
+            # Bytes per second (for dummy)
+            to_bit = 1
+            unit = ''
+        else:
+            # Bits per second (for real network administrator | Default)
+            to_bit = 8
+            unit = 'b'
+
+        # Formatted columns per interface, rebuilt when the stats or the display mode change
+        # (the UI is refreshed more often than the stats)
+        columns_stats, columns_mode, columns = self._columns_cache
+        columns_mode_new = (to_bit, args.network_cumul)
+        if columns_stats is not self.stats or columns_mode != columns_mode_new:
+            columns = {}
+            self._columns_cache = (self.stats, columns_mode_new, columns)
+
         # Interface list (sorted by name)
+        key_name = self.get_key()
         for i in self.sorted_stats():
+            key = i[key_name]
             # Do not display interface in down state (issue #765)
             if 'is_up' in i and not i['is_up']:
                 continue
             # Hide stats if never been different from 0 (issue #1787)
-            if all(self.get_views(item=i[self.get_key()], key=f, option='hidden') for f in self.hide_zero_fields):
+            if self._hidden_mask.get(key, False):
                 continue
 
             # Format stats
-            # Is there an alias for the interface name?
-            if i['alias'] is None:
-                if_name = i['interface_name'].split(':')[0]
-            else:
-                if_name = i['alias']
+            # Alias if defined, else the interface real name
+            if_name = self._if_names[key][1]
             if len(if_name) > name_max_width:
                 # Cut interface name if it is too long
                 if_name = '_' + if_name[-name_max_width + 1:]
@@ -258,47 +359,29 @@ class PluginModel(GlancesPluginModel):
 
             # Add the interface name
             ret.append(self.curse_new_line())
-            msg = '{:{width}}'.format(if_name, width=name_max_width)
+            msg = if_name.ljust(name_max_width)
             ret.append(self.curse_add_line(msg))
 
             # Display MAC address
             msg = f' MAC: {mac_address}'
             ret.append(self.curse_add_line(msg))
 
-            # Display Rx/Tx or cumulative stats
-            if args.byte:
-                # Bytes per second (for dummy)
-                to_bit = 1
-                unit = ''
-            else:
-                # Bits per second (for real network administrator | Default)
-                to_bit = 8
-                unit = 'b'
-
-            if args.network_cumul and 'bytes_recv' in i:
-                rx = self.auto_unit(int(i['bytes_recv'] * to_bit)) + unit
-                tx = self.auto_unit(int(i['bytes_sent'] * to_bit)) + unit
-                ax = self.auto_unit(int(i['bytes_all'] * to_bit)) + unit
-            elif 'bytes_recv_rate_per_sec' in i:
-                rx = self.auto_unit(int(i['bytes_recv_rate_per_sec'] * to_bit)) + unit
-                tx = self.auto_unit(int(i['bytes_sent_rate_per_sec'] * to_bit)) + unit
-                ax = self.auto_unit(int(i['bytes_all_rate_per_sec'] * to_bit)) + unit
-            else:
+            if key not in columns:
+                columns[key] = self.format_columns(i, to_bit, unit, args.network_cumul)
+            if columns[key] is None:
                 # Avoid issue when a new interface is created on the fly
                 # Example: start Glances, then start a new container
                 continue
+            rx, tx, ax = columns[key]
 
             if args.network_sum:
-                msg = f'{ax:>14}'
+                msg = ax.rjust(14)
                 ret.append(self.curse_add_line(msg))
             else:
-                msg = f'{rx:>7}'
-                ret.append(
-                    self.curse_add_line(msg, self.get_views(item=i[self.get_key()], key='bytes_recv', option='decoration'))
-                )
-                msg = f'{tx:>7}'
-                ret.append(
-                    self.curse_add_line(msg, self.get_views(item=i[self.get_key()], key='bytes_sent', option='decoration'))
-                )
+                view = self.views[key]
+                msg = rx.rjust(7)
+                ret.append(self.curse_add_line(msg, view['bytes_recv']['decoration']))
+                msg = tx.rjust(7)
+                ret.append(self.curse_add_line(msg, view['bytes_sent']['decoration']))
 
         return ret
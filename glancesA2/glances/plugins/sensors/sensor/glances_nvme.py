@@ -1,5 +1,108 @@
+import ctypes
+import os
+import re
+import shutil
+import struct
 import subprocess
+
+from glances.globals import LINUX
+from glances.logger import logger
 from glances.plugins.plugin.model import GlancesPluginModel
+from glances.timer import Timer
+
+# Import plugin specific dependency
+try:
+    from pySMART import Device
+except ImportError as e:
+    import_error_tag = True
+    logger.debug(f"Missing Python Lib ({e}), NVMe sensor will use the smartctl command")
+else:
+    import_error_tag = False
+
+if LINUX:
+    import fcntl
+
+# NVMe admin passthrough command (Linux, see include/uapi/linux/nvme_ioctl.h)
+# struct nvme_passthru_cmd: opcode, flags, rsvd1, nsid, cdw2, cdw3, metadata, addr,
+#                           metadata_len, data_len, cdw10...cdw15, timeout_ms, result
+NVME_ADMIN_CMD_FORMAT = '<BBHIIIQQIIIIIIIIII'
+NVME_IOCTL_ADMIN_CMD = 0xC0484E41  # _IOWR('N', 0x41, struct nvme_passthru_cmd)
+NVME_ADMIN_GET_LOG_PAGE = 0x02
+NVME_NSID_ALL = 0xFFFFFFFF
+NVME_LOG_SMART = 0x02
+NVME_SMART_LOG_SIZE = 512
+
+# smartctl command used when pySMART is not available
+# Search in the PATH first, then in the default Smartmontools install folder on Windows
+SMARTCTL_WINDOWS_PATH = r"C:\Program Files\Smartmontools\bin\smartctl.exe"
+
+# smartctl lines to grab (label: (stat name, value parser))
+# Example:
+# Temperature:                        35 Celsius
+# Percentage Used:                    3%
+# Power Cycles:                       1,234
+_NVME_RE = re.compile(r'^(Temperature|Power Cycles|Percentage Used):\s*(.*)$')
+_NVME_PARSERS = {
+    'Temperature': ('temperature', lambda v: int(v.split()[0])),
+    'Power Cycles': ('power_cycles', lambda v: int(v.replace(',', ''))),
+    'Percentage Used': ('percentage_used', lambda v: int(v.rstrip('%'))),
+}
+
+
+def read_nvme_smart_log(device):
+    """Read the SMART/Health log page (0x02) of the NVMe device with an admin command (Linux only).
+
+    Raise OSError if the device can not be opened or if the command is rejected.
+    """
+    log = ctypes.create_string_buffer(NVME_SMART_LOG_SIZE)
+    # Number of dwords to read (0's based) in the upper half of cdw10, log page id in the lower byte
+    cdw10 = ((NVME_SMART_LOG_SIZE // 4 - 1) << 16) | NVME_LOG_SMART
+    cmd = bytearray(struct.calcsize(NVME_ADMIN_CMD_FORMAT))
+    struct.pack_into(
+        NVME_ADMIN_CMD_FORMAT,
+        cmd,
+        0,
+        NVME_ADMIN_GET_LOG_PAGE,
+        0,
+        0,
+        NVME_NSID_ALL,
+        0,
+        0,
+        0,
+        ctypes.addressof(log),
+        0,
+        NVME_SMART_LOG_SIZE,
+        cdw10,
+        0,
+        0,
+        0,
+        0,
+        0,
+        0,
+        0,
+    )
+    fd = os.open(device, os.O_RDONLY)
+    try:
+        status = fcntl.ioctl(fd, NVME_IOCTL_ADMIN_CMD, cmd)
+    finally:
+        os.close(fd)
+    # A failed NVMe command returns a positive status (and leaves the log untouched)
+    if status != 0:
+        raise OSError(f"NVMe Get Log Page command failed on {device} (status {status:#x})")
+    return log.raw
+
+
+def parse_nvme_smart_log(log):
+    """Parse the SMART/Health log page (0x02) and return the NVMe stats.
+
+    Composite temperature: bytes 1-2 (Kelvin), percentage used: byte 5,
+    power cycles: bytes 112-127 (all little-endian).
+    """
+    return {
+        'temperature': struct.unpack_from('<H', log, 1)[0] - 273,
+        'percentage_used': log[5],
+        'power_cycles': int.from_bytes(log[112:128], 'little'),
+    }
 
 
 class PluginModel(GlancesPluginModel):
@@ -7,13 +110,15 @@ class PluginModel(GlancesPluginModel):
 
     def __init__(self, args=None, config=None):
         super().__init__(args=args, config=config, stats_init_value=[])
-        self.nvme = GlancesGrabNVMe()
+        nvme_device = self.get_conf_value('nvme_device', default=['/dev/sdc'])[0]
+        nvme_refresh = float(self.get_conf_value('nvme_refresh', default=5))
+        self.nvme = GlancesGrabNVMe(device=nvme_device, min_interval=nvme_refresh)
         self.display_curse = True
 
     def update(self):
         stats = self.get_init_value()
         nvme_data = self.nvme.get()
-        if nvme_data:
+        if 'temperature' in nvme_data:
             stats.append({'label': 'NVMe Temp', 'value': nvme_data['temperature'], 'unit': 'C'})
         self.stats = stats
         return self.stats
@@ -35,32 +140,108 @@ class PluginModel(GlancesPluginModel):
         return ret
 
 class GlancesGrabNVMe:
-    """Fetch NVMe stats using the smartctl command."""
+    """Fetch NVMe stats.
 
-    def __init__(self):
-        pass
+    Use the NVMe admin command on Linux, else pySMART, else the smartctl command.
+    """
+
+    def __init__(self, device='/dev/sdc', min_interval=5):
+        self.device = device
+
+        # SMART data changes slowly: poll the device at most every min_interval seconds
+        # and serve the cached stats in between
+        self.min_interval = min_interval
+        self._cached = {}
+        self._poll_timer = Timer(0)
+
+        # Linux: read the SMART/Health log page directly from the NVMe device
+        self.use_ioctl = False
+        if LINUX and device.startswith('/dev/nvme'):
+            try:
+                read_nvme_smart_log(device)
+            except OSError as e:
+                logger.debug(f"Cannot read NVMe device {device} SMART log ({e})")
+            else:
+                self.use_ioctl = True
+
+        # Probe the device only once, the pySMART object is reused on each update
+        self._dev = None
+        if not self.use_ioctl and not import_error_tag:
+            try:
+                self._dev = Device(device, interface='nvme')
+            except Exception as e:
+                logger.debug(f"Cannot init NVMe device {device} with pySMART ({e})")
+
+        # Fallback: find the smartctl command once (None if not installed)
+        self.smartctl = None
+        if not self.use_ioctl and self._dev is None:
+            self.smartctl = shutil.which('smartctl') or shutil.which(SMARTCTL_WINDOWS_PATH)
+            if self.smartctl is None:
+                logger.debug("smartctl command not found, NVMe sensor is disabled")
 
     def get(self):
-        """Fetch NVMe data and return relevant stats."""
+        """Fetch NVMe data and return relevant stats (cached between two polls)."""
+        if not self._poll_timer.finished():
+            return self._cached
+        if self.use_ioctl:
+            self._cached = self.get_ioctl()
+        elif self._dev is not None:
+            self._cached = self.get_pysmart()
+        else:
+            self._cached = self.get_smartctl()
+        self._poll_timer.reset(self.min_interval)
+        return self._cached
+
+    def get_ioctl(self):
+        """Fetch NVMe data from the SMART/Health log page of the device."""
+        try:
+            return parse_nvme_smart_log(read_nvme_smart_log(self.device))
+        except OSError as e:
+            logger.debug(f"Cannot read NVMe device {self.device} SMART log ({e})")
+            return {}
+
+    def get_pysmart(self):
+        """Fetch NVMe data from the cached pySMART device."""
+        nvme_data = {}
+        try:
+            self._dev.update()
+        except Exception as e:
+            logger.debug(f"Cannot update NVMe device {self.device} ({e})")
+            return nvme_data
+        if self._dev.temperature is not None:
+            nvme_data['temperature'] = self._dev.temperature
+        attributes = self._dev.if_attributes
+        if getattr(attributes, 'powerCycles', None) is not None:
+            nvme_data['power_cycles'] = attributes.powerCycles
+        if getattr(attributes, 'percentageUsed', None) is not None:
+            nvme_data['percentage_used'] = attributes.percentageUsed
+        return nvme_data
+
+    def get_smartctl(self):
+        """Fetch NVMe data by parsing the smartctl command output."""
         nvme_data = {}
+        if self.smartctl is None:
+            return nvme_data
         try:
             output = subprocess.check_output(
-                [r"C:\Program Files\Smartmontools\bin\smartctl.exe", '-a', '/dev/sdc', '-d', 'nvme'],
+                [self.smartctl, '-a', self.device, '-d', 'nvme'],
                 universal_newlines=True
             )
             nvme_data = self.parse_nvme_output(output)
-        except subprocess.CalledProcessError as e:
-            print(f"Error executing smartctl: {e}")
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.debug(f"Error executing smartctl: {e}")
         return nvme_data
 
     def parse_nvme_output(self, output):
         """Parse the output from smartctl to extract NVMe stats."""
         nvme_data = {}
         for line in output.splitlines():
-            if 'Temperature:' in line:
-                nvme_data['temperature'] = int(line.split()[-2])
-            elif 'Power Cycles:' in line:
-                nvme_data['power_cycles'] = int(line.split()[-1])
-            elif 'Percentage Used:' in line:
-                nvme_data['percentage_used'] = int(line.split()[-1].replace('%', ''))
+            match = _NVME_RE.match(line)
+            if match is None:
+                continue
+            name, parser = _NVME_PARSERS[match.group(1)]
+            nvme_data[name] = parser(match.group(2))
+            if len(nvme_data) == len(_NVME_PARSERS):
+                # All the stats are grabbed, no need to parse the remaining lines
+                break
         return nvme_data
@@ -0,0 +1,38 @@
+import struct
+from unittest.mock import patch
+
+import pytest
+
+from glances.plugins.sensors.sensor.glances_nvme import (
+    NVME_ADMIN_CMD_FORMAT,
+    parse_nvme_smart_log,
+    read_nvme_smart_log,
+)
+
+# SMART/Health log page (0x02) of a drive at 35°C (308 K), 3% used with 1234 power cycles
+# Bytes 0-5: critical warning, composite temperature, available spare (100%), spare threshold (10%), percentage used
+SMART_LOG = bytes.fromhex('00' '3401' '64' '0a' '03') + bytes(106) + (1234).to_bytes(16, 'little') + bytes(384)
+
+
+# Test a rejected admin command (positive NVMe status) raises instead of returning an empty log
+def test_read_nvme_smart_log_failure():
+    with patch('glances.plugins.sensors.sensor.glances_nvme.os.open', return_value=3), patch(
+        'glances.plugins.sensors.sensor.glances_nvme.os.close'
+    ), patch('glances.plugins.sensors.sensor.glances_nvme.fcntl', create=True) as mock_fcntl:
+        mock_fcntl.ioctl.return_value = 0x4002  # Invalid log page
+        with pytest.raises(OSError):
+            read_nvme_smart_log('/dev/nvme0')
+
+
+# Test the admin command matches the kernel struct nvme_passthru_cmd size
+def test_admin_cmd_size():
+    assert struct.calcsize(NVME_ADMIN_CMD_FORMAT) == 72
+
+
+# Test the SMART/Health log page parsing
+def test_parse_nvme_smart_log():
+    result = parse_nvme_smart_log(SMART_LOG)
+
+    assert result['temperature'] == 35
+    assert result['percentage_used'] == 3
+    assert result['power_cycles'] == 1234
@@ -7,6 +7,7 @@
 #
 
 import os
+import socket
 
 import psutil
 
@@ -377,12 +378,13 @@ class GlancesProcesses:
         """
         try:
             # Hack for issue #2754 (PsUtil 6+)
+            # Grab TCP and UDP connections with a single call and split them by socket type
             if psutil_version_info[0] >= 6:
-                tcp = len(process.net_connections(kind="tcp"))
-                udp = len(process.net_connections(kind="udp"))
+                connections = process.net_connections(kind="inet")
             else:
-                tcp = len(process.connections(kind="tcp"))
-                udp = len(process.connections(kind="udp"))
+                connections = process.connections(kind="inet")
+            tcp = sum(1 for c in connections if c.type == socket.SOCK_STREAM)
+            udp = sum(1 for c in connections if c.type == socket.SOCK_DGRAM)
         except (psutil.AccessDenied, psutil.NoSuchProcess):
             # Manage issue1283 (psutil.AccessDenied)
             tcp = None
@@ -1,11 +1,15 @@
+import shutil
 import subprocess
 import time
 
+# Search smartctl in the PATH first, then in the default Smartmontools install folder on Windows
+SMARTCTL = shutil.which('smartctl') or shutil.which(r"C:\Program Files\Smartmontools\bin\smartctl.exe")
+
 def check_nvme_temperature():
     try:
         # Run smartctl to get NVMe stats
         output = subprocess.check_output(
-            [r"C:\Program Files\Smartmontools\bin\smartctl.exe", '-a', '/dev/sdc', '-d', 'nvme'],
+            [SMARTCTL, '-a', '/dev/sdc', '-d', 'nvme'],
             universal_newlines=True
         )
 
@@ -20,6 +24,8 @@ def check_nvme_temperature():
         print(f"Error executing smartctl: {e}")
 
 if __name__ == "__main__":
+    if SMARTCTL is None:
+        raise SystemExit("smartctl command not found")
     while True:
         check_nvme_temperature()
         time.sleep(5)  # Check every 5 seconds
@@ -14,6 +14,15 @@ from glances.globals import nativestr
 from glances.logger import logger
 from glances.plugins.plugin.model import GlancesPluginModel
 
+# Import optional dependency (JIT compile the I/O rates classifier)
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    numba_tag = False
+else:
+    numba_tag = True
+
 # Fields description
 # description: human readable description
 # short_name: shortname to use un UI
@@ -50,6 +59,46 @@ items_history_list = [
     {'name': 'write_bytes_rate_per_sec', 'description': 'Bytes write per second', 'y_unit': 'B/s'},
 ]
 
+# I/O rate thresholds (in bytes per second) and the matching decorations
+RATE_CAREFUL = 0
+RATE_WARNING = 10 * 1024 * 1024
+RATE_CRITICAL = 50 * 1024 * 1024
+RATE_DECORATIONS = ('DEFAULT', 'CAREFUL', 'WARNING', 'CRITICAL')
+
+
+def classify_rates(rates, out, careful, warning, critical):
+    """Set in out the decoration index (0: DEFAULT to 3: CRITICAL) of each rate.
+
+    CRITICAL if rate >= critical, WARNING if rate >= warning, CAREFUL if rate > careful.
+    """
+    for i in range(len(rates)):
+        r = rates[i]
+        if r >= critical:
+            out[i] = 3
+        elif r >= warning:
+            out[i] = 2
+        elif r > careful:
+            out[i] = 1
+        else:
+            out[i] = 0
+    return out
+
+
+if numba_tag:
+    classify_rates = njit(cache=True)(classify_rates)
+
+
+def rates_decoration(rates):
+    """Return the decoration (DEFAULT, CAREFUL, WARNING or CRITICAL) of each I/O rate."""
+    if numba_tag:
+        rates = np.asarray(rates, dtype=np.float64)
+        out = np.empty(rates.size, dtype=np.int8)
+    else:
+        out = [0] * len(rates)
+    return [
+        RATE_DECORATIONS[c] for c in classify_rates(rates, out, RATE_CAREFUL, RATE_WARNING, RATE_CRITICAL)
+    ]
+
 
 class PluginModel(GlancesPluginModel):
     """Glances disks I/O plugin.
@@ -77,6 +126,9 @@ class PluginModel(GlancesPluginModel):
             self.hide_zero = False
         self.hide_zero_fields = ['read_bytes_rate_per_sec', 'write_bytes_rate_per_sec']
 
+        # Read and write rates decoration per disk (computed in update_views)
+        self._rates_decoration = {}
+
         # Force a first update because we need two updates to have the first stat
         self.update()
         self.refresh_timer.set(0)
@@ -142,6 +194,16 @@ class PluginModel(GlancesPluginModel):
         super().update_views()
 
         # Add specifics information
+        # Decoration of the read and write rates, computed for all the disks at once
+        # Rates default to 0 if missing
+        stats = self.get_raw()
+        read_decorations = rates_decoration([i.get('read_bytes_rate_per_sec', 0) for i in stats])
+        write_decorations = rates_decoration([i.get('write_bytes_rate_per_sec', 0) for i in stats])
+        self._rates_decoration = {
+            i[self.get_key()]: decorations
+            for i, decorations in zip(stats, zip(read_decorations, write_decorations))
+        }
+
         # Alert
         for i in self.get_raw():
             disk_real_name = i['disk_name']
@@ -197,6 +259,9 @@ class PluginModel(GlancesPluginModel):
             if all(self.get_views(item=i[self.get_key()], key=f, option='hidden') for f in self.hide_zero_fields):
                 continue
 
+            # Decoration based on I/O rate thresholds (computed in update_views)
+            read_decoration, write_decoration = self._rates_decoration.get(i[self.get_key()], ('DEFAULT', 'DEFAULT'))
+
             # Get the disk name
             disk_name = i['alias'] if 'alias' in i else i['disk_name']
 
@@ -214,25 +279,6 @@ class PluginModel(GlancesPluginModel):
             read_rate = i.get('read_bytes_rate_per_sec', 0)
             write_rate = i.get('write_bytes_rate_per_sec', 0)
 
-            # Define decoration based on I/O rate thresholds
-            if read_rate >= 50 * 1024 * 1024:  # Above 50 MB/s
-                read_decoration = 'CRITICAL'
-            elif read_rate >= 10 * 1024 * 1024:  # Between 10 MB/s and 50 MB/s
-                read_decoration = 'WARNING'
-            elif read_rate > 0:  # Below 10 MB/s
-                read_decoration = 'CAREFUL'
-            else:
-                read_decoration = 'DEFAULT'
-
-            if write_rate >= 50 * 1024 * 1024:  # Above 50 MB/s
-                write_decoration = 'CRITICAL'
-            elif write_rate >= 10 * 1024 * 1024:  # Between 10 MB/s and 50 MB/s
-                write_decoration = 'WARNING'
-            elif write_rate > 0:  # Below 10 MB/s
-                write_decoration = 'CAREFUL'
-            else:
-                write_decoration = 'DEFAULT'
-
             # Convert rates to human-readable units
             txps = self.auto_unit(read_rate)
             rxps = self.auto_unit(write_rate)
@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import patch, MagicMock
 import psutil
-from glances.plugins.diskio import PluginModel  # Correctly using PluginModel
+from glances.plugins.diskio import PluginModel, rates_decoration  # Correctly using PluginModel
 
 
 @pytest.fixture
@@ -204,3 +204,12 @@ def test_get_color_no_warning(mock_psutil_disk_io_counters):
     assert 'CAREFUL' not in result[0]  # Check that 'CAREFUL' is not in the result
     assert 'WARNING' not in result[0]  # Check that 'WARNING' is not in the result
     assert 'CRITICAL' not in result[0]   # Check that 'CRITICAL' is not in the result
+
+
+# Test the I/O rates classifier on the thresholds boundaries
+def test_rates_decoration():
+    rates = [0, 0.5, 1, 10 * 1024 * 1024 - 1, 10 * 1024 * 1024, 50 * 1024 * 1024 - 1, 50 * 1024 * 1024]
+
+    result = rates_decoration(rates)
+
+    assert result == ['DEFAULT', 'CAREFUL', 'CAREFUL', 'CAREFUL', 'WARNING', 'WARNING', 'CRITICAL']